@@ -9,7 +9,11 @@ It supports uint8 and uint16 data types, arbitrary bit depths, multi-component
 images, optional per-pixel masking, and histogram accumulation.
 """
 
-from ihist._ihist import histogram
+try:
+    from ihist._ihist import histogram
+except ImportError:
+    # Pure-NumPy fallback for environments without the compiled extension.
+    from ihist._fallback import histogram
 
 __all__ = [
     "histogram",
@@ -0,0 +1,169 @@
+# This file is part of ihist
+# Copyright 2025 Board of Regents of the University of Wisconsin System
+# SPDX-License-Identifier: MIT
+
+"""Pure-NumPy fallback for the compiled _ihist extension.
+
+Implements the same interface, validation, and semantics as the extension's
+histogram(), so that ihist remains usable (more slowly) where the extension
+cannot be loaded. Error messages are kept identical to the extension's.
+"""
+
+import numpy as np
+
+_UINT32_MAX = 2**32 - 1
+
+
+def _image_geometry(image: np.ndarray) -> tuple[int, int, int]:
+    if image.ndim == 1:
+        return 1, image.shape[0], 1
+    if image.ndim == 2:
+        return image.shape[0], image.shape[1], 1
+    return image.shape[0], image.shape[1], image.shape[2]
+
+
+def _validate_mask(
+    mask: np.ndarray, image_ndim: int, height: int, width: int
+) -> None:
+    if mask.dtype != np.uint8:
+        raise ValueError("Mask must have dtype uint8")
+    if image_ndim == 1:
+        if mask.ndim != 1:
+            raise ValueError(
+                f"Mask must be 1D when image is 1D, got {mask.ndim}D"
+            )
+        if mask.shape[0] != width:
+            raise ValueError(
+                f"Mask length {mask.shape[0]} does not match image width "
+                f"{width}"
+            )
+    else:
+        if mask.ndim != 2:
+            raise ValueError(
+                f"Mask must be 2D when image is 2D or 3D, got {mask.ndim}D"
+            )
+        if mask.shape != (height, width):
+            raise ValueError(
+                f"Mask shape {mask.shape[0]}x{mask.shape[1]} does not match "
+                f"image shape {height}x{width}"
+            )
+
+
+def _validate_out(
+    out: np.ndarray, n_hist_components: int, n_bins: int
+) -> None:
+    if out.dtype != np.uint32:
+        raise ValueError("Output must have dtype uint32")
+    if out.ndim == 1:
+        if n_hist_components > 1:
+            raise ValueError("Output must be 2D for multi-component histogram")
+        if out.shape[0] != n_bins:
+            raise ValueError(
+                f"Output shape ({out.shape[0]},) does not match expected "
+                f"({n_bins},)"
+            )
+    elif out.ndim == 2:
+        if out.shape != (n_hist_components, n_bins):
+            raise ValueError(
+                f"Output shape ({out.shape[0]}, {out.shape[1]}) does not "
+                f"match expected ({n_hist_components}, {n_bins})"
+            )
+    else:
+        raise ValueError(f"Output must be 1D or 2D, got {out.ndim}D")
+
+
+def histogram(
+    image,
+    *,
+    bits=None,
+    mask=None,
+    components=None,
+    out=None,
+    accumulate=False,
+    parallel=True,
+):
+    """Compute histogram of image pixel values.
+
+    Pure-NumPy implementation with the same interface and semantics as the
+    compiled extension; see ihist.histogram for the full documentation. The
+    parallel argument is accepted but has no effect.
+    """
+    image = np.asarray(image)
+    if image.dtype == np.uint8:
+        max_bits = 8
+    elif image.dtype == np.uint16:
+        max_bits = 16
+    else:
+        raise ValueError("Image must have dtype uint8 or uint16")
+
+    if image.ndim < 1 or image.ndim > 3:
+        raise ValueError(f"Image must be 1D, 2D, or 3D, got {image.ndim}D")
+    height, width, n_components = _image_geometry(image)
+
+    n_pixels = height * width
+    if n_pixels > _UINT32_MAX:
+        raise ValueError(
+            f"Image has too many pixels ({n_pixels}); maximum is "
+            f"{_UINT32_MAX} to avoid histogram overflow"
+        )
+
+    sample_bits = max_bits
+    if bits is not None:
+        if bits < 0 or bits > max_bits:
+            raise ValueError(
+                f"bits must be in range [0, {max_bits}], got {bits}"
+            )
+        sample_bits = bits
+
+    if components is None:
+        component_indices = list(range(n_components))
+    else:
+        component_indices = [int(c) for c in components]
+        for idx in component_indices:
+            if idx < 0 or idx >= n_components:
+                raise ValueError(
+                    f"Component index {idx} out of range [0, {n_components})"
+                )
+    n_hist_components = len(component_indices)
+
+    if mask is not None:
+        mask = np.asarray(mask)
+        _validate_mask(mask, image.ndim, height, width)
+
+    n_bins = 1 << sample_bits
+
+    if out is not None:
+        out = np.asarray(out)
+        _validate_out(out, n_hist_components, n_bins)
+        if np.shares_memory(out, image):
+            raise ValueError("Output buffer overlaps with input image")
+        if mask is not None and np.shares_memory(out, mask):
+            raise ValueError("Output buffer overlaps with mask")
+        result = out
+    else:
+        # Return 2D if image is 3D or components explicitly specified; this
+        # makes it easy to write generic code that handles any number of
+        # components.
+        force_2d = image.ndim == 3 or components is not None
+        if n_hist_components == 1 and not force_2d:
+            result = np.empty(n_bins, dtype=np.uint32)
+        else:
+            result = np.empty((n_hist_components, n_bins), dtype=np.uint32)
+
+    hist2d = result if result.ndim == 2 else result[np.newaxis, :]
+    if out is None or not accumulate:
+        hist2d[...] = 0
+
+    samples = image.reshape(height, width, n_components)
+    if mask is not None:
+        samples = samples[mask.reshape(height, width) != 0]
+    else:
+        samples = samples.reshape(n_pixels, n_components)
+    for i, c in enumerate(component_indices):
+        values = samples[:, c]
+        if sample_bits < max_bits:
+            # Values wider than sample_bits are discarded.
+            values = values[values < n_bins]
+        hist2d[i] += np.bincount(values, minlength=n_bins).astype(np.uint32)
+
+    return result
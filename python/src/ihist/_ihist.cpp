@@ -24,55 +24,89 @@ namespace {
 // Requires pixels to be contiguous along one axis (which becomes "width");
 // the other axis can have arbitrary stride (row padding). For 2D/3D, either
 // axis 0 or 1 may be contiguous. For 3D, components must also be contiguous
-// (axis 2). For incompatible layouts, creates a C-contiguous copy.
+// (axis 2). Single-component images strided by a whole number of elements
+// are handled without a copy by reporting a component_step() > 1. For
+// incompatible layouts, creates a C-contiguous copy.
 class ImageView {
   public:
     ImageView(nb::ndarray<nb::ro> &image, std::size_t ndim, std::size_t height,
               std::size_t width, std::size_t n_components, bool is_8bit)
         : data_(image.data()), height_(height), width_(width), stride_(width),
-          pixel_size_((is_8bit ? 1 : 2) * n_components), transposed_(false) {
+          pixel_size_((is_8bit ? 1 : 2) * n_components), component_step_(1),
+          transposed_(false) {
+        // nanobind strides are in elements (DLPack convention), not bytes.
         std::size_t const elem_size = is_8bit ? 1 : 2;
+        std::size_t const pixel_elems = n_components;
         bool compat = false;
 
         if (ndim == 1) {
-            compat =
-                (image.stride(0) == static_cast<std::intptr_t>(elem_size));
+            compat = (image.stride(0) == 1);
         } else {
             bool const components_contig =
-                (ndim == 2) ||
-                (image.stride(2) == static_cast<std::intptr_t>(elem_size));
+                (ndim == 2) || (image.stride(2) == 1);
 
-            if (components_contig && pixel_size_ != 0) {
+            if (components_contig && pixel_elems != 0) {
                 if (image.stride(1) ==
-                    static_cast<std::intptr_t>(pixel_size_)) {
+                    static_cast<std::intptr_t>(pixel_elems)) {
                     // Axis 1 contiguous: rows along axis 0
                     if (image.stride(0) >=
-                            static_cast<std::intptr_t>(width * pixel_size_) &&
+                            static_cast<std::intptr_t>(width * pixel_elems) &&
                         static_cast<std::size_t>(image.stride(0)) %
-                                pixel_size_ ==
+                                pixel_elems ==
                             0) {
                         compat = true;
                         stride_ = static_cast<std::size_t>(image.stride(0)) /
-                                  pixel_size_;
+                                  pixel_elems;
                     }
                 } else if (image.stride(0) ==
-                           static_cast<std::intptr_t>(pixel_size_)) {
+                           static_cast<std::intptr_t>(pixel_elems)) {
                     // Axis 0 contiguous: rows along axis 1
                     if (image.stride(1) >=
-                            static_cast<std::intptr_t>(height * pixel_size_) &&
+                            static_cast<std::intptr_t>(height * pixel_elems) &&
                         static_cast<std::size_t>(image.stride(1)) %
-                                pixel_size_ ==
+                                pixel_elems ==
                             0) {
                         compat = true;
                         transposed_ = true;
                         std::swap(height_, width_);
                         stride_ = static_cast<std::size_t>(image.stride(1)) /
-                                  pixel_size_;
+                                  pixel_elems;
                     }
                 }
             }
         }
 
+        // Single-component images whose samples are separated by a whole
+        // number of elements (e.g. every-other-column views) can be processed
+        // without a copy by treating each group of elements as one pixel with
+        // extra components; the caller then histograms only component 0. The
+        // kernels read all "components" of each pixel, so the caller must
+        // keep them away from the final pixel, whose unselected trailing
+        // elements may lie beyond the underlying buffer (see the kernel
+        // invocation in histogram()).
+        if (!compat && n_components == 1 && ndim <= 2) {
+            auto const sample_stride =
+                ndim == 1 ? image.stride(0) : image.stride(1);
+            if (sample_stride > 1) {
+                std::size_t const step =
+                    static_cast<std::size_t>(sample_stride);
+                if (ndim == 1) {
+                    compat = true;
+                    component_step_ = step;
+                    pixel_size_ = step * elem_size;
+                } else if (image.stride(0) >= static_cast<std::intptr_t>(
+                                                  width * step) &&
+                           static_cast<std::size_t>(image.stride(0)) % step ==
+                               0) {
+                    compat = true;
+                    component_step_ = step;
+                    pixel_size_ = step * elem_size;
+                    stride_ =
+                        static_cast<std::size_t>(image.stride(0)) / step;
+                }
+            }
+        }
+
         if (!compat) {
             auto image_c =
                 nb::cast<nb::ndarray<nb::ro, nb::c_contig>>(image.cast());
@@ -92,6 +126,9 @@ class ImageView {
     [[nodiscard]] auto pixel_size() const -> std::size_t {
         return pixel_size_;
     }
+    [[nodiscard]] auto component_step() const -> std::size_t {
+        return component_step_;
+    }
     [[nodiscard]] auto transposed() const -> bool { return transposed_; }
 
     [[nodiscard]] auto memory_span() const -> std::size_t {
@@ -115,8 +152,10 @@ class ImageView {
     std::size_t width_;      // Effective width (may be swapped for F-order)
     std::size_t stride_;     // Row stride in pixels
     std::size_t pixel_size_; // Bytes per pixel
-    nb::object owner_;       // Prevents deallocation of any copy
-    bool transposed_;        // True if axis 0 is contiguous (H/W swapped)
+    std::size_t component_step_; // Elements per pixel (1 unless the image is
+                                 // an element-strided single-component view)
+    nb::object owner_;           // Prevents deallocation of any copy
+    bool transposed_;            // True if axis 0 is contiguous (H/W swapped)
 };
 
 // Analyzed mask array for zero-copy histogram processing.
@@ -260,24 +299,27 @@ nb::object histogram(nb::ndarray<nb::ro> image,
             ? n_components
             : nb::len(nb::cast<nb::sequence>(components_obj));
 
-    std::vector<std::size_t> component_indices(n_hist_components);
-    std::iota(component_indices.begin(), component_indices.end(), 0);
-    if (!components_obj.is_none()) {
+    // Note that using the sequence protocol (rather than nb::ndarray) means
+    // lists, tuples, and ranges are iterated directly, with no intermediate
+    // array construction.
+    std::vector<std::size_t> component_indices;
+    component_indices.reserve(n_hist_components);
+    if (components_obj.is_none()) {
+        component_indices.resize(n_hist_components);
+        std::iota(component_indices.begin(), component_indices.end(), 0);
+    } else {
         auto const components_seq = nb::cast<nb::sequence>(components_obj);
-        std::transform(
-            component_indices.begin(), component_indices.end(),
-            component_indices.begin(), [&](std::size_t i) {
-                auto const idx_signed =
-                    nb::cast<std::int64_t>(components_seq[i]);
-                if (idx_signed < 0 ||
-                    static_cast<std::size_t>(idx_signed) >= n_components) {
-                    throw std::invalid_argument(
-                        "Component index " + std::to_string(idx_signed) +
-                        " out of range [0, " + std::to_string(n_components) +
-                        ")");
-                }
-                return static_cast<std::size_t>(idx_signed);
-            });
+        for (nb::handle item : components_seq) {
+            auto const idx_signed = nb::cast<std::int64_t>(item);
+            if (idx_signed < 0 ||
+                static_cast<std::size_t>(idx_signed) >= n_components) {
+                throw std::invalid_argument(
+                    "Component index " + std::to_string(idx_signed) +
+                    " out of range [0, " + std::to_string(n_components) + ")");
+            }
+            component_indices.push_back(
+                static_cast<std::size_t>(idx_signed));
+        }
     }
 
     MaskView const msk = [&]() {
@@ -388,27 +430,78 @@ nb::object histogram(nb::ndarray<nb::ro> image,
         hist_ptr = out_arr.data();
     }
 
+    // The nb::ndarray allocated above is uninitialized, so we pay for zeroing
+    // only once, here (the kernels accumulate into the histogram).
     if (out_obj.is_none() || !accumulate) {
-        std::fill(hist_ptr, std::next(hist_ptr, hist_size), 0);
+        std::memset(hist_ptr, 0, hist_size * sizeof(std::uint32_t));
     }
 
+    // A component_step > 1 means unused elements are interleaved between the
+    // (single-component) pixels; present them to the kernel as additional,
+    // unselected components (the selected indices are all 0 in that case).
+    std::size_t const kernel_n_components =
+        n_components * img.component_step();
+
     // We could keep the GIL acquired when data size is small (say, less than
     // 500 elements; should benchmark), but always release for now.
     if (n_hist_components > 0) {
         nb::gil_scoped_release gil_released;
 
-        if (is_8bit) {
-            ihist_hist8_2d(sample_bits,
-                           static_cast<std::uint8_t const *>(img.data()),
-                           msk.data(), img.height(), img.width(), img.stride(),
-                           msk.stride(), n_components, n_hist_components,
-                           component_indices.data(), hist_ptr, parallel);
-        } else {
-            ihist_hist16_2d(
-                sample_bits, static_cast<std::uint16_t const *>(img.data()),
-                msk.data(), img.height(), img.width(), img.stride(),
-                msk.stride(), n_components, n_hist_components,
-                component_indices.data(), hist_ptr, parallel);
+        auto const run_kernel = [&](std::size_t first_row, std::size_t n_rows,
+                                    std::size_t n_cols) {
+            auto const *data = static_cast<char const *>(img.data()) +
+                               first_row * img.stride() * img.pixel_size();
+            auto const *mask_data =
+                msk.data() == nullptr ? nullptr
+                                      : msk.data() + first_row * msk.stride();
+            if (is_8bit) {
+                ihist_hist8_2d(sample_bits,
+                               reinterpret_cast<std::uint8_t const *>(data),
+                               mask_data, n_rows, n_cols, img.stride(),
+                               msk.stride(), kernel_n_components,
+                               n_hist_components, component_indices.data(),
+                               hist_ptr, parallel);
+            } else {
+                ihist_hist16_2d(sample_bits,
+                                reinterpret_cast<std::uint16_t const *>(data),
+                                mask_data, n_rows, n_cols, img.stride(),
+                                msk.stride(), kernel_n_components,
+                                n_hist_components, component_indices.data(),
+                                hist_ptr, parallel);
+            }
+        };
+
+        if (img.component_step() == 1) {
+            run_kernel(0, img.height(), img.width());
+        } else if (img.height() > 0 && img.width() > 0) {
+            // The kernels read every element of each pixel, including the
+            // unselected trailing "components", and for the final sample of
+            // an element-strided view those elements may lie beyond the
+            // underlying buffer (DLPack gives no buffer size to check
+            // against). All other trailing reads fall at or below the offset
+            // of some view element, hence within the buffer, so it suffices
+            // to exclude the final sample from the kernel calls and bin it
+            // here.
+            std::size_t const h = img.height();
+            std::size_t const w = img.width();
+            run_kernel(0, h - 1, w);
+            run_kernel(h - 1, 1, w - 1);
+            if (msk.data() == nullptr ||
+                msk.data()[(h - 1) * msk.stride() + (w - 1)] != 0) {
+                std::size_t const offset =
+                    ((h - 1) * img.stride() + (w - 1)) * img.component_step();
+                std::uint32_t const value =
+                    is_8bit
+                        ? static_cast<std::uint8_t const *>(img.data())[offset]
+                        : static_cast<std::uint16_t const *>(
+                              img.data())[offset];
+                // Out-of-range samples are discarded, as in the kernels.
+                if (value >> sample_bits == 0) {
+                    for (std::size_t i = 0; i < n_hist_components; ++i) {
+                        ++hist_ptr[i * n_bins + value];
+                    }
+                }
+            }
         }
     }
 
@@ -195,22 +195,22 @@ class TestMemoryLayout:
         assert hist[3] == 1
 
     def test_non_contiguous_accepted(self):
-        """Test that non-contiguous array is automatically converted."""
+        """Test that non-contiguous array is accepted."""
         image = np.zeros((10, 10), dtype=np.uint8)
         image[::2, ::2] = 5
         # Create non-contiguous view
         image_nc = image[::2, ::2]
 
-        # nanobind automatically converts to contiguous
+        # Handled without a copy via the element-strided view
         hist = ihist.histogram(image_nc)
         assert hist[5] == 25
         assert hist.sum() == 25
 
     def test_fortran_order_accepted(self):
-        """Test that Fortran-ordered array is automatically converted."""
+        """Test that Fortran-ordered array is accepted."""
         image = np.array([[0, 1], [2, 3]], dtype=np.uint8, order="F")
 
-        # nanobind automatically converts to C-contiguous
+        # Handled without a copy via the transposed view
         hist = ihist.histogram(image)
         assert hist[0] == 1
         assert hist[1] == 1
@@ -226,7 +226,7 @@ class TestMemoryLayout:
         # Create non-contiguous view
         image_nc = image[::2, ::2]
 
-        # Non-contiguous works due to automatic conversion
+        # Non-contiguous works without conversion
         hist_nc = ihist.histogram(image_nc)
         assert hist_nc[0] == 0  # No zero values in the view
         assert hist_nc[5] == 25  # 5x5 grid of 5s
@@ -534,8 +534,8 @@ class TestStridedArrayOptimization:
         assert hist[1].sum() == 80
         assert hist[2].sum() == 80
 
-    def test_non_contiguous_columns_requires_copy(self):
-        """Test that non-contiguous column stride falls back to copy."""
+    def test_non_contiguous_columns_no_copy(self):
+        """Test that whole-element column stride is handled without copy."""
         # Select every other column
         image = np.zeros((10, 10), dtype=np.uint8)
         image[:, ::2] = 42
@@ -543,15 +543,96 @@ class TestStridedArrayOptimization:
 
         assert not view.flags["C_CONTIGUOUS"]
 
-        # Should still work (via copy)
+        # Processed in place as pixels with an extra, unselected component
         hist = ihist.histogram(view)
         assert hist[42] == 50
 
-    def test_transposed_array_requires_copy(self):
-        """Test that transposed (Fortran order) array falls back to copy."""
+    def test_element_strided_1d_no_copy(self):
+        """Test that 1D view with element stride > 1 works without copy."""
+        base = np.arange(12, dtype=np.uint8)
+        view = base[::3]  # Values 0, 3, 6, 9
+
+        hist = ihist.histogram(view)
+        for i in (0, 3, 6, 9):
+            assert hist[i] == 1
+        assert hist.sum() == 4
+
+    def test_element_strided_16bit(self):
+        """Test 16-bit view with element stride > 1."""
+        base = np.zeros((10, 10), dtype=np.uint16)
+        base[:, ::2] = 1000
+        view = base[:, ::2]  # stride(1) = 4 bytes, 2 elements
+
+        hist = ihist.histogram(view, bits=12)
+        assert hist[1000] == 50
+        assert hist.sum() == 50
+
+    def test_element_strided_tail_at_end_of_buffer(self):
+        """Test element-strided view ending at the last element of its base.
+
+        The unselected trailing elements of the final pixel do not exist, so
+        the kernels must not be handed the full final pixel.
+        """
+        base = np.arange(10, dtype=np.uint8)
+        view = base[::3]  # Values 0, 3, 6, 9; nothing after the 9
+
+        hist = ihist.histogram(view)
+        for i in (0, 3, 6, 9):
+            assert hist[i] == 1
+        assert hist.sum() == 4
+
+    def test_element_strided_2d_tail_at_end_of_buffer(self):
+        """Test 2D element-strided view ending at the end of its base."""
+        base = np.arange(23, dtype=np.uint8)
+        view = np.lib.stride_tricks.as_strided(
+            base, shape=(3, 4), strides=(8, 2)
+        )
+
+        hist = ihist.histogram(view)
+        for i in range(0, 23, 2):
+            assert hist[i] == 1
+        assert hist.sum() == 12
+
+    def test_element_strided_tail_masked_out(self):
+        """Test element-strided view whose final sample is masked out."""
+        base = np.arange(10, dtype=np.uint8)
+        view = base[::3]
+        mask = np.array([1, 0, 1, 0], dtype=np.uint8)
+
+        hist = ihist.histogram(view, mask=mask)
+        assert hist[0] == 1
+        assert hist[6] == 1
+        assert hist.sum() == 2
+
+    def test_element_strided_tail_out_of_range(self):
+        """Test out-of-range final sample of element-strided view."""
+        base = np.zeros(7, dtype=np.uint16)
+        base[::3] = (100, 200, 5000)
+        view = base[::3]
+
+        hist = ihist.histogram(view, bits=12)
+        assert hist[100] == 1
+        assert hist[200] == 1
+        assert hist.sum() == 2  # 5000 is out of range and discarded.
+
+    def test_element_strided_with_mask(self):
+        """Test element-strided image combined with a mask."""
+        base = np.zeros((4, 8), dtype=np.uint8)
+        base[:, ::2] = 7
+        view = base[:, ::2]  # Shape (4, 4)
+
+        mask = np.zeros((4, 4), dtype=np.uint8)
+        mask[:2, :] = 1
+
+        hist = ihist.histogram(view, mask=mask)
+        assert hist[7] == 8
+        assert hist.sum() == 8
+
+    def test_transposed_array_no_copy(self):
+        """Test that transposed (Fortran order) array works without copy."""
         image = np.array([[1, 2], [3, 4]], dtype=np.uint8, order="F")
 
-        # Should work via copy
+        # Handled without a copy via the transposed view
         hist = ihist.histogram(image)
         assert hist[1] == 1
         assert hist[2] == 1
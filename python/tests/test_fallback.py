@@ -0,0 +1,126 @@
+# This file is part of ihist
+# Copyright 2025 Board of Regents of the University of Wisconsin System
+# SPDX-License-Identifier: MIT
+
+"""Tests for the pure-NumPy fallback implementation.
+
+The fallback must match the compiled extension's interface, results, and
+error messages, so that ihist behaves the same (apart from speed) where the
+extension cannot be loaded.
+"""
+
+import numpy as np
+import pytest
+
+import ihist
+from ihist import _fallback
+
+
+class TestFallbackResults:
+    """Test that the fallback produces correct histograms."""
+
+    def test_basic_8bit(self):
+        image = np.array([[10, 20], [30, 10]], dtype=np.uint8)
+        hist = _fallback.histogram(image)
+        assert hist.shape == (256,)
+        assert hist[10] == 2
+        assert hist[20] == 1
+        assert hist[30] == 1
+        assert hist.sum() == 4
+
+    def test_16bit_reduced_bits(self):
+        image = np.array([0, 100, 4095, 4096], dtype=np.uint16)
+        hist = _fallback.histogram(image, bits=12)
+        assert hist.shape == (4096,)
+        assert hist[0] == 1
+        assert hist[100] == 1
+        assert hist[4095] == 1
+        assert hist.sum() == 3  # 4096 is out of range and discarded.
+
+    def test_mask(self):
+        image = np.array([[10, 20], [30, 40]], dtype=np.uint8)
+        mask = np.array([[1, 0], [1, 0]], dtype=np.uint8)
+        hist = _fallback.histogram(image, mask=mask)
+        assert hist[10] == 1
+        assert hist[30] == 1
+        assert hist.sum() == 2
+
+    def test_components(self):
+        image = np.zeros((2, 2, 3), dtype=np.uint8)
+        image[:, :, 0] = 10
+        image[:, :, 1] = 20
+        image[:, :, 2] = 30
+        hist = _fallback.histogram(image, components=[2, 0])
+        assert hist.shape == (2, 256)
+        assert hist[0, 30] == 4
+        assert hist[1, 10] == 4
+
+    def test_out_and_accumulate(self):
+        image = np.array([1, 2], dtype=np.uint8)
+        out = np.zeros(256, dtype=np.uint32)
+        out[1] = 10
+        result = _fallback.histogram(image, out=out, accumulate=True)
+        assert result is out
+        assert result[1] == 11
+        assert result[2] == 1
+
+    def test_matches_extension(self):
+        rng = np.random.default_rng(42)
+        image = rng.integers(0, 4096, (37, 23, 3), dtype=np.uint16)
+        mask = rng.integers(0, 2, (37, 23), dtype=np.uint8)
+        for kwargs in (
+            {},
+            {"bits": 12},
+            {"mask": mask, "bits": 12},
+            {"components": [1], "bits": 13},
+        ):
+            np.testing.assert_array_equal(
+                _fallback.histogram(image, **kwargs),
+                ihist.histogram(image, **kwargs),
+            )
+
+
+class TestFallbackValidation:
+    """Test that the fallback rejects what the extension rejects."""
+
+    def test_invalid_dtype(self):
+        image = np.array([0, 1], dtype=np.int32)
+        with pytest.raises(
+            ValueError, match="must have dtype uint8 or uint16"
+        ):
+            _fallback.histogram(image)
+
+    def test_invalid_ndim(self):
+        image = np.zeros((2, 2, 2, 2), dtype=np.uint8)
+        with pytest.raises(ValueError, match="must be 1D, 2D, or 3D"):
+            _fallback.histogram(image)
+
+    def test_bits_out_of_range(self):
+        image = np.array([0], dtype=np.uint8)
+        with pytest.raises(ValueError, match="bits must be in range"):
+            _fallback.histogram(image, bits=9)
+
+    def test_component_out_of_range(self):
+        image = np.zeros((2, 2, 3), dtype=np.uint8)
+        with pytest.raises(
+            ValueError, match="Component index .* out of range"
+        ):
+            _fallback.histogram(image, components=[3])
+
+    def test_mask_shape_mismatch(self):
+        image = np.zeros((2, 2), dtype=np.uint8)
+        mask = np.zeros((2, 3), dtype=np.uint8)
+        with pytest.raises(ValueError, match="does not match image shape"):
+            _fallback.histogram(image, mask=mask)
+
+    def test_out_wrong_shape(self):
+        image = np.array([0], dtype=np.uint8)
+        out = np.zeros(128, dtype=np.uint32)
+        with pytest.raises(ValueError, match="does not match expected"):
+            _fallback.histogram(image, out=out)
+
+    def test_out_overlaps_image(self):
+        buf = np.zeros(256, dtype=np.uint32)
+        image = buf.view(np.uint8)[:100].reshape(10, 10)
+        with pytest.raises(ValueError, match="overlaps with input"):
+            _fallback.histogram(image, out=buf)
@@ -7,18 +7,20 @@
 # dependencies = [
 #     "matplotlib",
 #     "numpy",
+#     "orjson",
 #     "pandas",
 #     "seaborn",
 # ]
 # ///
 
 import argparse
-import json
+import itertools
 import subprocess
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
+import orjson
 import pandas as pd
 import seaborn as sns
 
@@ -53,44 +55,38 @@ def run_benchmark(
         raise
 
 
-def convert_json_entry(
-    raw: dict[str, str | int | float],
-) -> dict[str, str | int | float] | None:
+def load_results(*results_jsons: Path) -> pd.DataFrame:
+    # Chain the benchmark entries from all files before building the
+    # DataFrame, so column inference happens once and we avoid the extra
+    # copy of a concat of per-file frames.
+    entries = itertools.chain.from_iterable(
+        orjson.loads(f.read_bytes())["benchmarks"] for f in results_jsons
+    )
+    raw = pd.json_normalize(entries)
     # We leave out aggregate entries (mean, median, stddev, cv), which are easy
     # enough to recompute anyway.
-    if raw["run_type"] != "iteration":
-        return None
-
-    assert isinstance(raw["name"], str)
-    name_items = raw["name"].split("/")
-    implementation = name_items.pop(0)
-    pixel_type = name_items.pop(0)
-    name_items.remove("real_time")
-    name_items.remove("process_time")
-    name_dict = dict(i.split(":", 1) for i in name_items)
-
-    return {
-        "impl": implementation,
-        "pixel_type": pixel_type,
-        "bits": int(name_dict["bits"]),
-        "mask": bool(int(name_dict["mask"])),
-        "n_pixels": int(name_dict["size"]) ** 2,
-        "spread_percent": int(name_dict["spread"]),
-        "repetition_index": raw["repetition_index"],
-        "pixels_per_second": raw["pixels_per_second"],
-        "real_time_ms": raw["real_time"],
-        "cpu_time_ms": raw["cpu_time"],
-    }
-
-
-def load_results(results_json: Path) -> pd.DataFrame:
-    with open(results_json) as infile:
-        data = json.load(infile)
-    return pd.DataFrame(
-        cooked
-        for raw in data["benchmarks"]
-        if (cooked := convert_json_entry(raw)) is not None
+    raw = raw[raw["run_type"] == "iteration"]
+    # The name fields are in a fixed order (see api_bench.cpp), so a single
+    # regex over the Series parses them all.
+    name = raw["name"].str.extract(
+        r"^(?P<impl>[^/]+)/(?P<pixel_type>[^/]+)/bits:(?P<bits>\d+)"
+        r"/mask:(?P<mask>\d)/size:(?P<size>\d+)/spread:(?P<spread>\d+)"
     )
+    assert not name.isna().any().any()
+    return pd.DataFrame(
+        {
+            "impl": name["impl"],
+            "pixel_type": name["pixel_type"],
+            "bits": name["bits"].astype(int),
+            "mask": name["mask"].astype(int).astype(bool),
+            "n_pixels": name["size"].astype(int) ** 2,
+            "spread_percent": name["spread"].astype(int),
+            "repetition_index": raw["repetition_index"].astype(int),
+            "pixels_per_second": raw["pixels_per_second"],
+            "real_time_ms": raw["real_time"],
+            "cpu_time_ms": raw["cpu_time"],
+        }
+    ).reset_index(drop=True)
 
 
 def plot_results(df: pd.DataFrame) -> None:
@@ -99,31 +95,31 @@ def plot_results(df: pd.DataFrame) -> None:
     def geometric_mean(v):
         return np.prod(v) ** (1 / len(v))
 
-    # OpenCV is not always MT-enabled, so skip opencv-mt in that case.
-    def calc_opencv_speedup(row):
-        if row["impl"] != "opencv-mt":
-            return pd.NA
-        single_threaded = data[
-            (data["impl"] == "opencv")
-            & (data["pixel_type"] == row["pixel_type"])
-            & (data["bits"] == row["bits"])
-            & (data["mask"] == row["mask"])
-            & (data["n_pixels"] == row["n_pixels"])
-            & (data["spread_percent"] == row["spread_percent"])
-            & (data["repetition_index"] == row["repetition_index"])
-        ]
-        assert len(single_threaded) == 1
-        st_row = single_threaded.iloc[0]
-        return st_row["real_time_ms"] / row["real_time_ms"]
-
-    opencv_speedups_mask0 = (
-        data[np.logical_not(data["mask"])]
-        .apply(calc_opencv_speedup, axis=1)
-        .dropna()
-    )
-    opencv_speedups_mask1 = (
-        data[data["mask"]].apply(calc_opencv_speedup, axis=1).dropna()
+    # OpenCV is not always MT-enabled, so skip opencv-mt in that case. Join
+    # each opencv-mt row with its single-threaded opencv counterpart (same
+    # configuration and repetition) to get the per-row speedups.
+    match_keys = [
+        "pixel_type",
+        "bits",
+        "mask",
+        "n_pixels",
+        "spread_percent",
+        "repetition_index",
+    ]
+    opencv_st = data.loc[
+        data["impl"] == "opencv", match_keys + ["real_time_ms"]
+    ]
+    opencv_mt = data[data["impl"] == "opencv-mt"].merge(
+        opencv_st,
+        on=match_keys,
+        how="left",
+        suffixes=("", "_st"),
+        validate="one_to_one",
     )
+    assert not opencv_mt["real_time_ms_st"].isna().any()
+    opencv_speedups = opencv_mt["real_time_ms_st"] / opencv_mt["real_time_ms"]
+    opencv_speedups_mask0 = opencv_speedups[np.logical_not(opencv_mt["mask"])]
+    opencv_speedups_mask1 = opencv_speedups[opencv_mt["mask"]]
     opencv_speedup_cutoff = 1.05
     if (
         len(opencv_speedups_mask0)
@@ -255,9 +251,7 @@ def main() -> None:
     for pixel_format in pixel_formats:
         unmasked_f = results_file(*pixel_format, False, args.data_size)
         masked_f = results_file(*pixel_format, True, args.data_size)
-        unmasked_df = load_results(unmasked_f)
-        masked_df = load_results(masked_f)
-        df = pd.concat([unmasked_df, masked_df], ignore_index=True)
+        df = load_results(unmasked_f, masked_f)
         if args.plot:
             plot_results(df)
 
@@ -7,19 +7,22 @@
 # dependencies = [
 #     "matplotlib",
 #     "numpy",
+#     "orjson",
 #     "pandas",
 #     "seaborn",
 # ]
 # ///
 
 import argparse
-import json
+import functools
+import itertools
 import re
 import subprocess
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
+import orjson
 import pandas as pd
 import seaborn as sns
 
@@ -75,92 +78,78 @@ def run_benchmark(
         raise
 
 
-def convert_json_entry(
-    raw: dict[str, str | int | float],
-) -> dict[str, str | int | float] | None:
+def load_results(*results_jsons: Path) -> pd.DataFrame:
+    # Chain the benchmark entries from all files before building the
+    # DataFrame, so column inference happens once and we avoid the extra
+    # copy of a concat of per-file frames.
+    entries = itertools.chain.from_iterable(
+        orjson.loads(f.read_bytes())["benchmarks"] for f in results_jsons
+    )
+    raw = pd.json_normalize(entries)
     # We leave out aggregate entries (mean, median, stddev, cv), which are easy
     # enough to recompute anyway.
-    if raw["run_type"] != "iteration":
-        return None
-
-    assert isinstance(raw["name"], str)
-    name_items = raw["name"].split("/")
-    pixel_type = name_items.pop(0)
-    name_items.remove("real_time")
-    name_items.remove("process_time")
-    name_dict = dict(i.split(":", 1) for i in name_items)
-
-    return {
-        "pixel_type": pixel_type,
-        "bits": int(name_dict["bits"]),
-        "input": name_dict["input"],
-        "mask": bool(int(name_dict["mask"])),
-        "mt": bool(int(name_dict["mt"])),
-        "stripes": int(name_dict["stripes"]),
-        "unrolls": int(name_dict["unrolls"]),
-        "n_pixels": int(name_dict["size"]) ** 2,
-        "spread_percent": int(name_dict["spread"]),
-        "grain_size": int(name_dict["grainsize"]),
-        "repetition_index": raw["repetition_index"],
-        "pixels_per_second": raw["pixels_per_second"],
-        "real_time": raw["real_time"],
-        "cpu_time": raw["cpu_time"],
-    }
-
-
-def load_results(results_json: Path) -> pd.DataFrame:
-    with open(results_json) as infile:
-        data = json.load(infile)
-    return pd.DataFrame(
-        cooked
-        for raw in data["benchmarks"]
-        if (cooked := convert_json_entry(raw)) is not None
+    raw = raw[raw["run_type"] == "iteration"]
+    # The name fields are in a fixed order (see bench_name() in
+    # ihist_bench.cpp), so a single regex over the Series parses them all.
+    name = raw["name"].str.extract(
+        r"^(?P<pixel_type>[^/]+)/bits:(?P<bits>\d+)/input:(?P<input>[^/]+)"
+        r"/mask:(?P<mask>\d)/mt:(?P<mt>\d)/stripes:(?P<stripes>\d+)"
+        r"/unrolls:(?P<unrolls>\d+)/size:(?P<size>\d+)/spread:(?P<spread>\d+)"
+        r"/grainsize:(?P<grainsize>\d+)"
     )
+    assert not name.isna().any().any()
+    return pd.DataFrame(
+        {
+            "pixel_type": name["pixel_type"],
+            "bits": name["bits"].astype(int),
+            "input": name["input"],
+            "mask": name["mask"].astype(int).astype(bool),
+            "mt": name["mt"].astype(int).astype(bool),
+            "stripes": name["stripes"].astype(int),
+            "unrolls": name["unrolls"].astype(int),
+            "n_pixels": name["size"].astype(int) ** 2,
+            "spread_percent": name["spread"].astype(int),
+            "grain_size": name["grainsize"].astype(int),
+            "repetition_index": raw["repetition_index"].astype(int),
+            "pixels_per_second": raw["pixels_per_second"],
+            "real_time": raw["real_time"],
+            "cpu_time": raw["cpu_time"],
+        }
+    ).reset_index(drop=True)
 
 
 def plot_results(df: pd.DataFrame) -> None:
     data = df.copy()
 
-    def calc_speedup(row):
-        single_threaded = data[
-            (data["pixel_type"] == row["pixel_type"])
-            & (data["bits"] == row["bits"])
-            & (data["input"] == row["input"])
-            & (data["mask"] == row["mask"])
-            & np.logical_not(data["mt"])
-            & (data["stripes"] == row["stripes"])
-            & (data["unrolls"] == row["unrolls"])
-            & (data["n_pixels"] == row["n_pixels"])
-            & (data["spread_percent"] == row["spread_percent"])
-            & (data["repetition_index"] == row["repetition_index"])
-        ]
-        assert len(single_threaded) == 1
-        st_row = single_threaded.iloc[0]
-        return st_row["real_time"] / row["real_time"]
-
-    def calc_effncores(row):
-        return row["cpu_time"] / row["real_time"]
-
-    def calc_eff(row):
-        single_threaded = data[
-            (data["pixel_type"] == row["pixel_type"])
-            & (data["bits"] == row["bits"])
-            & (data["input"] == row["input"])
-            & (data["mask"] == row["mask"])
-            & np.logical_not(data["mt"])
-            & (data["stripes"] == row["stripes"])
-            & (data["unrolls"] == row["unrolls"])
-            & (data["n_pixels"] == row["n_pixels"])
-            & (data["spread_percent"] == row["spread_percent"])
-            & (data["repetition_index"] == row["repetition_index"])
-        ]
-        assert len(single_threaded) == 1
-        st_row = single_threaded.iloc[0]
-        return st_row["cpu_time"] / row["cpu_time"]
-
-    data["speedup"] = data.apply(calc_speedup, axis=1)
-    data["effective_n_cores"] = data.apply(calc_effncores, axis=1)
-    data["efficiency"] = data.apply(calc_eff, axis=1)
+    # Join each row with its single-threaded counterpart (same configuration
+    # and repetition) so the ratios are computed column-wise rather than with
+    # a per-row scan of the whole frame.
+    match_keys = [
+        "pixel_type",
+        "bits",
+        "input",
+        "mask",
+        "stripes",
+        "unrolls",
+        "n_pixels",
+        "spread_percent",
+        "repetition_index",
+    ]
+    single_threaded = data.loc[
+        np.logical_not(data["mt"]), match_keys + ["real_time", "cpu_time"]
+    ]
+    data = data.merge(
+        single_threaded,
+        on=match_keys,
+        how="left",
+        suffixes=("", "_st"),
+        validate="many_to_one",
+    )
+    assert not data["real_time_st"].isna().any()
+    data["speedup"] = data["real_time_st"] / data["real_time"]
+    data["effective_n_cores"] = data["cpu_time"] / data["real_time"]
+    data["efficiency"] = data["cpu_time_st"] / data["cpu_time"]
+    data = data.drop(columns=["real_time_st", "cpu_time_st"])
 
     # Treat data size as categories, not continuous variable.
     data_sizes = sorted(data["n_pixels"].unique())
@@ -232,18 +221,29 @@ def all_pixel_formats() -> list[tuple[str, int]]:
     return list((t, b) for t in ("mono", "abc", "abcx") for b in (8, 12, 16))
 
 
+@functools.cache
+def _load_tuning(file: Path) -> dict[tuple[str, int, int], tuple[int, int]]:
+    # Parse the whole tuning file once; read_tuning is then a dict lookup.
+    ptrn = re.compile(r"TUNE\((\w+), ([0-9]+), ([01]), ([0-9]+), ([0-9]+)\)")
+    tuning = {}
+    with open(file) as f:
+        for line in f:
+            if m := ptrn.match(line):
+                key = (m.group(1), int(m.group(2)), int(m.group(3)))
+                tuning[key] = (int(m.group(4)), int(m.group(5)))
+    return tuning
+
+
 def read_tuning(
     pixel_type: str, bits: int, mask: bool, file: Path
 ) -> tuple[int, int]:
     imask = 1 if mask else 0
-    ptrn = f"TUNE\\({pixel_type}, {bits}, {imask}, ([0-9]+), ([0-9]+)\\)"
-    with open(file) as f:
-        while line := f.readline():
-            if m := re.match(ptrn, line):
-                return int(m.group(1)), int(m.group(2))
-    raise ValueError(
-        f"Tuning for {pixel_type}{bits}_mask{imask} not found in {file}"
-    )
+    try:
+        return _load_tuning(file)[(pixel_type, bits, imask)]
+    except KeyError:
+        raise ValueError(
+            f"Tuning for {pixel_type}{bits}_mask{imask} not found in {file}"
+        ) from None
 
 
 def main() -> None:
@@ -288,9 +288,7 @@ def main() -> None:
     for pixel_format in pixel_formats:
         unmasked_f = results_file(*pixel_format, False)
         masked_f = results_file(*pixel_format, True)
-        unmasked_df = load_results(unmasked_f)
-        masked_df = load_results(masked_f)
-        df = pd.concat([unmasked_df, masked_df], ignore_index=True)
+        df = load_results(unmasked_f, masked_f)
         if args.plot:
             plot_results(df)
 
@@ -7,6 +7,7 @@
 # dependencies = [
 #     "matplotlib",
 #     "numpy",
+#     "orjson",
 #     "pandas",
 #     "seaborn",
 # ]
@@ -14,12 +15,13 @@
 
 import argparse
 import itertools
-import json
+import os
 import subprocess
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
+import orjson
 import pandas as pd
 import seaborn as sns
 
@@ -28,13 +30,32 @@ _benchmark_dir = _script_dir / "../builddir/benchmarks"
 
 
 def run_benchmark(
-    pixel_type: str, bits: int, repetitions: int, out_json: Path
+    pixel_type: str,
+    repetitions: int,
+    out_json: Path,
+    pin_core: int | None = None,
 ) -> None:
+    # Run all bit depths of a pixel type in a single invocation, to amortize
+    # process startup and benchmark warmup over the whole pixel type. The
+    # depths are all of those registered by ihist_bench (see u8_bits and
+    # u16_bits in ihist_bench.cpp), so that the cached results serve any
+    # --bits value, not just the --all ones.
+
+    # Pinning the benchmark process to a single core keeps the scheduler from
+    # migrating it mid-run, which reduces timing variance enough that fewer
+    # repetitions usually suffice.
+    if pin_core is not None:
+
+        def preexec_fn() -> None:
+            os.sched_setaffinity(0, {pin_core})
+    else:
+        preexec_fn = None
+
     try:
         subprocess.run(
             [
                 f"{_benchmark_dir}/ihist_bench",
-                f"--benchmark_filter=^{pixel_type}/bits:{bits}/input:2d/.*/mt:0/.*/size:4096/",
+                f"--benchmark_filter=^{pixel_type}/bits:(8|10|12|14|16)/input:2d/.*/mt:0/.*/size:4096/",
                 f"--benchmark_repetitions={repetitions}",
                 "--benchmark_enable_random_interleaving",
                 f"--benchmark_out={out_json}",
@@ -42,49 +63,41 @@ def run_benchmark(
                 "--benchmark_time_unit=ms",
             ],
             check=True,
+            preexec_fn=preexec_fn,
         )
     except subprocess.CalledProcessError:
         out_json.unlink(missing_ok=True)
         raise
 
 
-def convert_json_entry(
-    raw: dict[str, str | int | float],
-) -> dict[str, str | int | float] | None:
+def load_results(results_json: Path) -> pd.DataFrame:
+    data = orjson.loads(results_json.read_bytes())
+    raw = pd.json_normalize(data["benchmarks"])
     # We leave out aggregate entries (mean, median, stddev, cv), which are easy
     # enough to recompute anyway.
-    if raw["run_type"] != "iteration":
-        return None
-
-    assert isinstance(raw["name"], str)
-    name_items = raw["name"].split("/")
-    pixel_type = name_items.pop(0)
-    name_items.remove("real_time")
-    name_items.remove("process_time")
-    name_dict = dict(i.split(":", 1) for i in name_items)
-
-    return {
-        "pixel_type": pixel_type,
-        "bits": int(name_dict["bits"]),
-        "input": name_dict["input"],
-        "mask": bool(int(name_dict["mask"])),
-        "stripes": int(name_dict["stripes"]),
-        "unrolls": int(name_dict["unrolls"]),
-        "n_pixels": int(name_dict["size"]) ** 2,
-        "spread_percent": int(name_dict["spread"]),
-        "repetition_index": raw["repetition_index"],
-        "pixels_per_second": raw["pixels_per_second"],
-    }
-
-
-def load_results(results_json: Path) -> pd.DataFrame:
-    with open(results_json) as infile:
-        data = json.load(infile)
-    return pd.DataFrame(
-        cooked
-        for raw in data["benchmarks"]
-        if (cooked := convert_json_entry(raw)) is not None
+    raw = raw[raw["run_type"] == "iteration"]
+    # The name fields are in a fixed order (see bench_name() in
+    # ihist_bench.cpp), so a single regex over the Series parses them all.
+    name = raw["name"].str.extract(
+        r"^(?P<pixel_type>[^/]+)/bits:(?P<bits>\d+)/input:(?P<input>[^/]+)"
+        r"/mask:(?P<mask>\d)/mt:\d/stripes:(?P<stripes>\d+)"
+        r"/unrolls:(?P<unrolls>\d+)/size:(?P<size>\d+)/spread:(?P<spread>\d+)"
     )
+    assert not name.isna().any().any()
+    return pd.DataFrame(
+        {
+            "pixel_type": name["pixel_type"],
+            "bits": name["bits"].astype(int),
+            "input": name["input"],
+            "mask": name["mask"].astype(int).astype(bool),
+            "stripes": name["stripes"].astype(int),
+            "unrolls": name["unrolls"].astype(int),
+            "n_pixels": name["size"].astype(int) ** 2,
+            "spread_percent": name["spread"].astype(int),
+            "repetition_index": raw["repetition_index"].astype(int),
+            "pixels_per_second": raw["pixels_per_second"],
+        }
+    ).reset_index(drop=True)
 
 
 def compute_score(df: pd.DataFrame) -> float:
@@ -98,8 +111,10 @@ def compute_score(df: pd.DataFrame) -> float:
     # Geometric mean of the different spreads (0, 1, 6, 25, 100) naturally
     # weight the middle values (1, 6, 25) a little more than the extreme values
     # (0, 100), which is probably what we want.
+    # The medians are O(1) after the 1e-9 scaling, so the plain product does
+    # not overflow and we can skip the log/exp round trip.
     def geo_mean(v):
-        return np.exp(np.mean(np.log(v)))
+        return np.prod(v) ** (1 / len(v))
 
     return geo_mean(medians * 1e-9)
 
@@ -135,8 +150,8 @@ def plot_results(df: pd.DataFrame) -> None:
     plt.show()
 
 
-def results_file(pixel_type: str, bits: int) -> Path:
-    return Path(f"{_benchmark_dir}/{pixel_type}{bits}.json")
+def results_file(pixel_type: str) -> Path:
+    return Path(f"{_benchmark_dir}/{pixel_type}.json")
 
 
 def all_pixel_formats() -> list[tuple[str, int]]:
@@ -156,25 +171,43 @@ def main() -> None:
         metavar="TYPE",
         default="mono",
     )
-    parser.add_argument("--bits", type=int, metavar="BITS", default=8)
+    parser.add_argument(
+        "--bits",
+        type=int,
+        choices=(8, 10, 12, 14, 16),
+        metavar="BITS",
+        default=8,
+    )
     parser.add_argument("--repetitions", type=int, metavar="N", default=5)
+    parser.add_argument("--pin-core", type=int, metavar="CORE", default=None)
     parser.add_argument("--plot", action="store_true", dest="plot")
     parser.add_argument("--rerun", action="store_true")
     args = parser.parse_args()
 
+    if args.pin_core is not None and not hasattr(os, "sched_setaffinity"):
+        parser.error("--pin-core is only supported on Linux")
+
     pixel_formats = (
         all_pixel_formats() if args.all else [(args.pixel_type, args.bits)]
     )
 
-    for pixel_format in pixel_formats:
-        f = results_file(*pixel_format)
+    # Benchmark runs are deliberately sequential: concurrent ihist_bench
+    # processes would contend for cores and memory bandwidth and corrupt the
+    # timings we are tuning on.
+    for pixel_type in dict.fromkeys(t for t, _ in pixel_formats):
+        f = results_file(pixel_type)
         if args.rerun or not f.exists():
             run_benchmark(
-                *pixel_format, repetitions=args.repetitions, out_json=f
+                pixel_type,
+                repetitions=args.repetitions,
+                out_json=f,
+                pin_core=args.pin_core,
             )
     for pixel_format in pixel_formats:
-        f = results_file(*pixel_format)
+        pixel_type, bits = pixel_format
+        f = results_file(pixel_type)
         df = load_results(f)
+        df = df[df["bits"] == bits].reset_index(drop=True)
         for mask in (False, True):
             dataset: pd.DataFrame = df[df["mask"] == mask]
             striping = dataset["stripes"].unique()
@@ -191,7 +224,6 @@ def main() -> None:
                         )
                     ]
                 )
-            pixel_type, bits = pixel_format
             i_stripes, i_unrolls = np.unravel_index(
                 np.argmax(scores), scores.shape
             )
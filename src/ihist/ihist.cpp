@@ -297,6 +297,54 @@ void dispatch_common_pixel_formats(
         hist_2d_impl<T, Bits, XabcMask0, XabcMask1, 4, 1, 2, 3>(
             sample_bits, image, mask, height, width, image_stride, mask_stride,
             histogram, maybe_parallel);
+    } else if (n_components == 3 && n_hist_components == 1 &&
+               component_indices[0] < 3) {
+        // Single component of a 3-component image: use the striped kernels
+        // (with the mono tunings, since there is one histogram) rather than
+        // the dynamic fallback. The kernels read the interleaved pixels in a
+        // single pass, so no deinterleaving pass is needed.
+        switch (component_indices[0]) {
+        case 0:
+            hist_2d_impl<T, Bits, MonoMask0, MonoMask1, 3, 0>(
+                sample_bits, image, mask, height, width, image_stride,
+                mask_stride, histogram, maybe_parallel);
+            break;
+        case 1:
+            hist_2d_impl<T, Bits, MonoMask0, MonoMask1, 3, 1>(
+                sample_bits, image, mask, height, width, image_stride,
+                mask_stride, histogram, maybe_parallel);
+            break;
+        case 2:
+            hist_2d_impl<T, Bits, MonoMask0, MonoMask1, 3, 2>(
+                sample_bits, image, mask, height, width, image_stride,
+                mask_stride, histogram, maybe_parallel);
+            break;
+        }
+    } else if (n_components == 4 && n_hist_components == 1 &&
+               component_indices[0] < 4) {
+        // Single component of a 4-component image (see above).
+        switch (component_indices[0]) {
+        case 0:
+            hist_2d_impl<T, Bits, MonoMask0, MonoMask1, 4, 0>(
+                sample_bits, image, mask, height, width, image_stride,
+                mask_stride, histogram, maybe_parallel);
+            break;
+        case 1:
+            hist_2d_impl<T, Bits, MonoMask0, MonoMask1, 4, 1>(
+                sample_bits, image, mask, height, width, image_stride,
+                mask_stride, histogram, maybe_parallel);
+            break;
+        case 2:
+            hist_2d_impl<T, Bits, MonoMask0, MonoMask1, 4, 2>(
+                sample_bits, image, mask, height, width, image_stride,
+                mask_stride, histogram, maybe_parallel);
+            break;
+        case 3:
+            hist_2d_impl<T, Bits, MonoMask0, MonoMask1, 4, 3>(
+                sample_bits, image, mask, height, width, image_stride,
+                mask_stride, histogram, maybe_parallel);
+            break;
+        }
     } else {
         // General case: dynamic implementation
         hist_2d_dynamic<T, Bits>(sample_bits, image, mask, height, width,
@@ -334,8 +382,30 @@ ihist_hist16_2d(size_t sample_bits, uint16_t const *IHIST_RESTRICT image,
                 size_t const *IHIST_RESTRICT component_indices,
                 uint32_t *IHIST_RESTRICT histogram, bool maybe_parallel) {
 
-    // For 16-bit, use 12-bit path for sample_bits <= 12, otherwise 16-bit
-    if (sample_bits <= 12) {
+    // For 16-bit, dispatch to the smallest compile-time bin count (10, 12,
+    // 14, or 16 bits) that holds sample_bits, so that the kernels run with a
+    // constant bin count and the smallest workable bin table. The 10- and
+    // 14-bit tiers reuse the 12- and 16-bit tunings, respectively, which are
+    // close enough in table size.
+    //
+    // The full 16-bit bin table (256 KiB) exceeds L1D, and one could imagine
+    // a two-pass radix scheme (partition pixels by high bits, then histogram
+    // each partition with an L1-resident table). We don't: the partitioning
+    // pass writes and re-reads the entire image, roughly tripling memory
+    // traffic for a kernel that is memory-bound on realistic inputs, and the
+    // worst case (wide spread) is exactly where the extra passes cost most.
+    // Striping plus the reduced-bits dispatch covers the practical cases.
+    if (sample_bits <= 10) {
+        dispatch_common_pixel_formats<
+            std::uint16_t, 10, tuning_12bit_mono_mask0,
+            tuning_12bit_mono_mask1, tuning_12bit_abc_mask0,
+            tuning_12bit_abc_mask1, tuning_12bit_abcx_mask0,
+            tuning_12bit_abcx_mask1, tuning_12bit_xabc_mask0,
+            tuning_12bit_xabc_mask1>(sample_bits, image, mask, height, width,
+                                     image_stride, mask_stride, n_components,
+                                     n_hist_components, component_indices,
+                                     histogram, maybe_parallel);
+    } else if (sample_bits <= 12) {
         dispatch_common_pixel_formats<
             std::uint16_t, 12, tuning_12bit_mono_mask0,
             tuning_12bit_mono_mask1, tuning_12bit_abc_mask0,
@@ -345,6 +415,16 @@ ihist_hist16_2d(size_t sample_bits, uint16_t const *IHIST_RESTRICT image,
                                      image_stride, mask_stride, n_components,
                                      n_hist_components, component_indices,
                                      histogram, maybe_parallel);
+    } else if (sample_bits <= 14) {
+        dispatch_common_pixel_formats<
+            std::uint16_t, 14, tuning_16bit_mono_mask0,
+            tuning_16bit_mono_mask1, tuning_16bit_abc_mask0,
+            tuning_16bit_abc_mask1, tuning_16bit_abcx_mask0,
+            tuning_16bit_abcx_mask1, tuning_16bit_xabc_mask0,
+            tuning_16bit_xabc_mask1>(sample_bits, image, mask, height, width,
+                                     image_stride, mask_stride, n_components,
+                                     n_hist_components, component_indices,
+                                     histogram, maybe_parallel);
     } else {
         dispatch_common_pixel_formats<
             std::uint16_t, 16, tuning_16bit_mono_mask0,
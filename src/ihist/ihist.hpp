@@ -51,6 +51,11 @@ namespace ihist {
 struct tuning_parameters {
     // Number of separate histograms to iterate over (to tune for store-to-load
     // latency hiding vs spatial locality).
+    // Striping is our (portable) answer to the serial dependency on repeated
+    // bins[idx]++ increments. AVX-512 gather/VPCONFLICTD/scatter could attack
+    // the same dependency in-vector, but gather/scatter throughput makes it a
+    // wash on current CPUs and it would tie the kernels to one ISA; we stay
+    // intrinsics-free and let tuning pick the stripe count per arch instead.
     std::size_t n_stripes;
 
     // Pixels processed per main loop iteration.
@@ -60,6 +65,11 @@ struct tuning_parameters {
 namespace internal {
 
 // Value to bin index. If value is out of range, return 1 + max bin index.
+// Bins are uniform with power-of-two width, so this is a branch-free shift
+// (plus a range check when there is an overflow bin); there is no boundary
+// table to search, so techniques that vectorize the bin lookup itself do not
+// apply. The expensive part of histogramming is the bins[idx]++ increment,
+// which the striped kernels address.
 template <typename T, unsigned Bits = 8 * sizeof(T), unsigned LoBit = 0>
 constexpr auto bin_index(T value) -> std::size_t {
     static_assert(std::is_unsigned_v<T>);
@@ -176,9 +186,14 @@ hist_striped_st(T const *IHIST_RESTRICT data,
     }
 
     // Use extra bin for overflows if applicable.
-    constexpr auto STRIPE_LEN =
+    constexpr auto HIST_LEN =
         NBINS + static_cast<std::size_t>(Bits + LoBit < 8 * sizeof(T));
-    constexpr bool USE_STRIPES = NSTRIPES > 1 || STRIPE_LEN > NBINS;
+    // Pad each stripe to whole cache lines (16 uint32 counts) so that stripes
+    // do not share a cache line at their boundary. Matters mostly for small
+    // Bits, where whole stripes would otherwise overlap in a line.
+    constexpr auto STRIPE_LEN =
+        NSTRIPES > 1 ? (HIST_LEN + 15) / 16 * 16 : HIST_LEN;
+    constexpr bool USE_STRIPES = NSTRIPES > 1 || HIST_LEN > NBINS;
 
     std::vector<std::uint32_t> stripes_storage;
     std::uint32_t *stripes = [&]() {
@@ -214,14 +229,16 @@ hist_striped_st(T const *IHIST_RESTRICT data,
 
         IHIST_PRAGMA_LOOP_UNROLL_FULL
         for (std::size_t k = 0; k < BLOCKSIZE; ++k) {
-            if (!UseMask || block_mask[k]) {
-                auto const stripe = (block * BLOCKSIZE + k) % NSTRIPES;
-                IHIST_PRAGMA_LOOP_UNROLL_FULL
-                for (std::size_t s = 0; s < NSAMPLES; ++s) {
-                    auto const s_index = s_indices[s];
-                    auto const bin = bins[k * SamplesPerPixel + s_index];
-                    ++stripes[(stripe * NSAMPLES + s) * STRIPE_LEN + bin];
-                }
+            // Masked-out pixels add 0 instead of branching; the unpredictable
+            // branch costs more than the wasted increment for typical masks.
+            std::uint32_t const inc =
+                UseMask ? static_cast<std::uint32_t>(block_mask[k] != 0) : 1;
+            auto const stripe = (block * BLOCKSIZE + k) % NSTRIPES;
+            IHIST_PRAGMA_LOOP_UNROLL_FULL
+            for (std::size_t s = 0; s < NSAMPLES; ++s) {
+                auto const s_index = s_indices[s];
+                auto const bin = bins[k * SamplesPerPixel + s_index];
+                stripes[(stripe * NSAMPLES + s) * STRIPE_LEN + bin] += inc;
             }
         }
     }
@@ -281,9 +298,14 @@ histxy_striped_st(T const *IHIST_RESTRICT data,
     }
 
     // Use extra bin for overflows if applicable.
-    constexpr auto STRIPE_LEN =
+    constexpr auto HIST_LEN =
         NBINS + static_cast<std::size_t>(Bits + LoBit < 8 * sizeof(T));
-    constexpr bool USE_STRIPES = NSTRIPES > 1 || STRIPE_LEN > NBINS;
+    // Pad each stripe to whole cache lines (16 uint32 counts) so that stripes
+    // do not share a cache line at their boundary. Matters mostly for small
+    // Bits, where whole stripes would otherwise overlap in a line.
+    constexpr auto STRIPE_LEN =
+        NSTRIPES > 1 ? (HIST_LEN + 15) / 16 * 16 : HIST_LEN;
+    constexpr bool USE_STRIPES = NSTRIPES > 1 || HIST_LEN > NBINS;
 
     std::vector<std::uint32_t> stripes_storage;
     std::uint32_t *stripes = [&]() {
@@ -321,14 +343,16 @@ histxy_striped_st(T const *IHIST_RESTRICT data,
 
             IHIST_PRAGMA_LOOP_UNROLL_FULL
             for (std::size_t k = 0; k < BLOCKSIZE; ++k) {
-                if (!UseMask || block_mask[k]) {
-                    auto const stripe = (block * BLOCKSIZE + k) % NSTRIPES;
-                    IHIST_PRAGMA_LOOP_UNROLL_FULL
-                    for (std::size_t s = 0; s < NSAMPLES; ++s) {
-                        auto const s_index = s_indices[s];
-                        auto const bin = bins[k * SamplesPerPixel + s_index];
-                        ++stripes[(stripe * NSAMPLES + s) * STRIPE_LEN + bin];
-                    }
+                // Branch-free mask handling; see hist_striped_st.
+                std::uint32_t const inc =
+                    UseMask ? static_cast<std::uint32_t>(block_mask[k] != 0)
+                            : 1;
+                auto const stripe = (block * BLOCKSIZE + k) % NSTRIPES;
+                IHIST_PRAGMA_LOOP_UNROLL_FULL
+                for (std::size_t s = 0; s < NSAMPLES; ++s) {
+                    auto const s_index = s_indices[s];
+                    auto const bin = bins[k * SamplesPerPixel + s_index];
+                    stripes[(stripe * NSAMPLES + s) * STRIPE_LEN + bin] += inc;
                 }
             }
         }